@@ -0,0 +1,169 @@
+import importlib.util
+import os
+import struct
+import sys
+
+import numpy as np
+import pytest
+
+MODULE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'unsmry_reader.py')
+
+
+def _header(name, num_records, record_type):
+    """Write a section header: block length, name, number of records, record type and block length again"""
+    payload = name.ljust(8).encode() + struct.pack('>i', num_records) + record_type.encode()
+    return struct.pack('>i', 16) + payload + struct.pack('>i', 16)
+
+
+def _section(name, record_type, values):
+    """Write one section, split into blocks of 1000 items (105 for CHAR) as Eclipse does"""
+    parts = [_header(name, len(values), record_type)]
+    block_items = 105 if record_type == 'CHAR' else 1000
+    dtypes = {'INTE': '>i4', 'REAL': '>f4', 'DOUB': '>f8', 'LOGI': '>i4'}
+    for start in range(0, len(values), block_items):
+        block = values[start:start + block_items]
+        if record_type == 'CHAR':
+            data = b''.join(value.ljust(8).encode() for value in block)
+        elif record_type == 'LOGI':
+            data = np.array([-1 if value else 0 for value in block], dtype='>i4').tobytes()
+        else:
+            data = np.array(block, dtype=dtypes[record_type]).tobytes()
+        parts.append(struct.pack('>i', len(data)) + data + struct.pack('>i', len(data)))
+    return b''.join(parts)
+
+
+def write_summary(root, num_wells=3, num_ministeps=5, restart_seqhdr=False, seed=0, extra_sections=()):
+    """Write a synthetic .SMSPEC and .UNSMRY file pair
+
+    Parameters:
+        root (string):         The root name of the files
+        num_wells (int):       The number of wells, with ten vectors each. More than 100 wells gives over 1000
+                                    vectors, so each PARAMS section is split into several blocks
+        num_ministeps (int):   The number of ministeps
+        restart_seqhdr (bool): Flag for whether to write a second SEQHDR half way through, so that the PARAMS
+                                    sections are not evenly spaced
+        seed (int):            Seed for the random summary data
+        extra_sections (list): (name, record type, values) of further sections to write at the end of the
+                                    .SMSPEC file
+
+    Returns:
+        dict: The contents written, with the values of the PARAMS sections as 'params' (ministeps x vectors)
+                and the index of each (keyword, wgname, num) in 'index'
+
+    """
+    nx, ny, nz = 10, 10, 5
+    blank = ':+:+:+:+'
+    wells = ['W{}'.format(i) for i in range(1, num_wells + 1)]
+    groups = ['G1', 'G2']
+    vectors = [('TIME', blank, 0), ('FOPR', blank, 0)]
+    for keyword in ['WOPR', 'WWPR', 'WBHP', 'WGOR', 'WOPT', 'WWCT', 'WGPR', 'WTHP', 'WLPR', 'WGIR']:
+        vectors += [(keyword, well, 0) for well in wells]
+    vectors += [('GOPR', group, 0) for group in groups]
+    vectors += [('BPR', blank, (3 - 1) * nx * ny + (2 - 1) * nx + 4),
+                ('CWPR', 'W1', 2),
+                ('RPR', blank, 3),
+                ('RWFT', blank, 1 + 32768 * (2 + 10)),
+                ('AAQR', blank, 1),
+                ('SOFR', 'W2', 3),
+                ('WOPR', blank, 0)]
+    units = ['UNIT{}'.format(i % 7) for i in range(len(vectors))]
+    smspec = b''.join([
+        _section('INTEHEAD', 'INTE', [1, 100]),
+        _section('RESTART', 'CHAR', [''] * 9),
+        _section('DIMENS', 'INTE', [len(vectors), nx, ny, nz, 0, 0]),
+        _section('KEYWORDS', 'CHAR', [vector[0] for vector in vectors]),
+        _section('WGNAMES', 'CHAR', [vector[1] for vector in vectors]),
+        _section('NUMS', 'INTE', [vector[2] for vector in vectors]),
+        _section('UNITS', 'CHAR', units),
+        _section('STARTDAT', 'INTE', [1, 2, 2001, 3, 4, 5500000]),
+        _section('RUNTIMED', 'DOUB', [1.5, -2.25, 3.125]),
+    ] + [_section(name, record_type, values) for name, record_type, values in extra_sections])
+    with open(root + '.SMSPEC', 'wb') as f:
+        f.write(smspec)
+    params = (np.random.default_rng(seed).standard_normal((num_ministeps, len(vectors))) * 100).astype(np.float32)
+    parts = [_section('SEQHDR', 'INTE', [12345])]
+    for step in range(num_ministeps):
+        if restart_seqhdr and step == num_ministeps // 2:
+            parts.append(_section('SEQHDR', 'INTE', [999]))
+        parts.append(_section('MINISTEP', 'INTE', [step]))
+        parts.append(_section('PARAMS', 'REAL', params[step].tolist()))
+    with open(root + '.UNSMRY', 'wb') as f:
+        f.write(b''.join(parts))
+    index = dict()
+    for i, vector in enumerate(vectors):
+        index.setdefault(vector, i)
+    return {'params': params, 'index': index, 'wells': wells, 'groups': groups, 'units': units}
+
+
+def _load_reader(use_numba):
+    """Import unsmry_reader, or a separate copy of it with numba hidden so that the plain python fallback is used"""
+    if use_numba:
+        sys.path.insert(0, os.path.dirname(MODULE_FILE))
+        try:
+            import unsmry_reader
+        finally:
+            sys.path.pop(0)
+        return unsmry_reader
+    saved = sys.modules.get('numba')
+    sys.modules['numba'] = None
+    try:
+        spec = importlib.util.spec_from_file_location('unsmry_reader_without_numba', MODULE_FILE)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if saved is None:
+            del sys.modules['numba']
+        else:
+            sys.modules['numba'] = saved
+    return module
+
+
+@pytest.fixture(scope='session', params=[True, False], ids=['numba', 'python'])
+def reader(request):
+    """The unsmry_reader module, with and without numba"""
+    return _load_reader(request.param)
+
+
+@pytest.fixture
+def summary(tmp_path):
+    """Write a small summary file pair, returning its root name and contents"""
+    root = str(tmp_path / 'CASE')
+    return root, write_summary(root)
+
+
+BLANK = ':+:+:+:+'
+
+# (keyword, identifier) as passed to vector(), the (keyword, wgname, num) stored in the file and the sign
+VECTORS = [
+    (('TIME', ''), ('TIME', BLANK, 0), 1),
+    (('FOPR', ''), ('FOPR', BLANK, 0), 1),
+    (('WOPR', 'W2'), ('WOPR', 'W2', 0), 1),
+    (('GOPR', 'G2'), ('GOPR', 'G2', 0), 1),
+    (('BPR', '4 2 3'), ('BPR', BLANK, 214), 1),
+    (('CWPR', 'W1 2'), ('CWPR', 'W1', 2), 1),
+    (('RPR', 3), ('RPR', BLANK, 3), 1),
+    (('RWFT', '1 2'), ('RWFT', BLANK, 1 + 32768 * 12), 1),
+    (('RWFT', '2 1'), ('RWFT', BLANK, 1 + 32768 * 12), -1),
+    (('AAQR', 1), ('AAQR', BLANK, 1), 1),
+    (('SOFR', 'W2 3'), ('SOFR', 'W2', 3), 1),
+]
+
+
+def check_vectors(data, contents):
+    """Check every vector in VECTORS, and the last well's WGIR, against the values written"""
+    params = contents['params']
+    last_well = contents['wells'][-1]
+    expected = VECTORS + [(('WGIR', last_well), ('WGIR', last_well, 0), 1)]
+    for (keyword, identifier), stored, sign in expected:
+        vector = data.vector(keyword, identifier)
+        assert vector.name == '{}:{}'.format(keyword, identifier)
+        np.testing.assert_array_equal(vector.to_numpy(), params[:, contents['index'][stored]] * sign)
+
+
+def corrupt(root, change):
+    """Apply a change to the bytes of the .UNSMRY file"""
+    with open(root + '.UNSMRY', 'rb') as f:
+        data = bytearray(f.read())
+    data = change(data)
+    with open(root + '.UNSMRY', 'wb') as f:
+        f.write(data)
@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+import pytest
+
+from conftest import check_vectors, write_summary
+
+
+def test_cache(reader, summary):
+    root, contents = summary
+    first = reader.SummaryData(root, on_demand=False, use_cache=True)
+    assert os.path.isfile(root + '.UNSMRY.npy') and os.path.isfile(root + '.SMSPEC.npz')
+    second = reader.SummaryData(root, on_demand=False, use_cache=True)
+    check_vectors(second, contents)
+    assert second.units_section == first.units_section
+    assert second.runtimed_section.tolist() == first.runtimed_section.tolist()
+    assert [section.tolist() for section in second.ministep] == [section.tolist() for section in first.ministep]
+
+
+def test_cache_not_written(reader, summary):
+    root, contents = summary
+    # A directory in place of the archive makes the cache impossible to write
+    os.mkdir(root + '.SMSPEC.npz')
+    data = reader.SummaryData(root, on_demand=False, use_cache=True)
+    check_vectors(data, contents)
+    assert sorted(os.listdir(os.path.dirname(root))) == ['CASE.SMSPEC', 'CASE.SMSPEC.npz', 'CASE.UNSMRY']
+
+
+@pytest.mark.parametrize('damage', [b'not an archive', b'PK\x03\x04 cut short'], ids=['garbage', 'bad-zip'])
+def test_damaged_cache(reader, summary, damage):
+    root, contents = summary
+    reader.SummaryData(root, on_demand=False, use_cache=True)
+    with open(root + '.SMSPEC.npz', 'wb') as f:
+        f.write(damage)
+    data = reader.SummaryData(root, on_demand=False, use_cache=True)
+    check_vectors(data, contents)
+    assert list(data.units_section) == contents['units']
+    # The damaged archive is replaced when the summary files are read in its place
+    with np.load(root + '.SMSPEC.npz', allow_pickle=False) as cache:
+        assert list(cache['units_section']) == contents['units']
+
+
+def test_stale_cache(reader, summary):
+    root, _ = summary
+    reader.SummaryData(root, on_demand=False, use_cache=True)
+    contents = write_summary(root, seed=1)
+    for filename in (root + '.SMSPEC', root + '.UNSMRY'):
+        stat = os.stat(filename)
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    check_vectors(reader.SummaryData(root, on_demand=False, use_cache=True), contents)
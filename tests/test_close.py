@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from conftest import write_summary
+
+
+@pytest.mark.parametrize('restart_seqhdr', [False, True], ids=['regular', 'restart'])
+def test_close_releases_mapping(reader, tmp_path, restart_seqhdr):
+    root = str(tmp_path / 'CASE')
+    contents = write_summary(root, restart_seqhdr=restart_seqhdr)
+    data = reader.SummaryData(root)
+    # Closing before the file has been mapped does nothing
+    data.close()
+    expected = data.vector('WOPR', 'W2').to_numpy()
+    mapping = data._SummaryData__unsmry_map.base.obj
+    assert not mapping.closed
+    data.close()
+    assert data._SummaryData__unsmry_map is None
+    assert mapping.closed
+    data.close()
+    # The file is mapped again for the next read
+    np.testing.assert_array_equal(data.vector('WOPR', 'W2').to_numpy(), expected)
+    np.testing.assert_array_equal(expected, contents['params'][:, contents['index'][('WOPR', 'W2', 0)]])
+    assert not data._SummaryData__unsmry_map.base.obj.closed
+    data.close()
@@ -0,0 +1,39 @@
+import datetime
+
+import pytest
+
+from conftest import check_vectors
+
+
+def test_smspec_contents(reader, summary):
+    root, contents = summary
+    data = reader.SummaryData(root)
+    assert data.start_date == datetime.datetime(2001, 2, 1, 3, 4, 5, 500000)
+    assert list(data.well_names) == contents['wells']
+    assert list(data.group_names) == contents['groups']
+    assert int(data.nlist) == contents['params'].shape[1]
+
+
+@pytest.mark.parametrize('on_demand', [True, False])
+def test_lookups(reader, summary, on_demand):
+    root, contents = summary
+    check_vectors(reader.SummaryData(root, on_demand=on_demand), contents)
+
+
+@pytest.mark.parametrize('keyword, message', [('LBPR', 'Local grid block data not currently supported'),
+                                              ('LCWPR', 'Local grid completion or connection data'),
+                                              ('LWOPR', 'Local grid well data not currently supported'),
+                                              ('ZOPR', r'Unexpected keyword first letter \(Z\)')])
+def test_unsupported_keywords(reader, summary, keyword, message):
+    root, _ = summary
+    with pytest.raises(Exception, match=message):
+        reader.SummaryData(root).vector(keyword, 'W1')
+
+
+@pytest.mark.parametrize('on_demand', [True, False])
+def test_missing_vector_raises_value_error(reader, summary, on_demand):
+    root, _ = summary
+    data = reader.SummaryData(root, on_demand=on_demand)
+    for keyword, identifier in [('WOPR', 'NONE'), ('FXXX', ''), ('RWFT', '7 8')]:
+        with pytest.raises(ValueError):
+            data.vector(keyword, identifier)
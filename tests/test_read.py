@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from conftest import check_vectors, write_summary
+
+
+@pytest.mark.parametrize('on_demand', [True, False])
+@pytest.mark.parametrize('layout', [{}, {'num_wells': 150}, {'restart_seqhdr': True}, {'num_ministeps': 1}],
+                         ids=['small', 'multi-block', 'restart', 'single-ministep'])
+def test_vectors(reader, tmp_path, on_demand, layout):
+    root = str(tmp_path / 'CASE')
+    contents = write_summary(root, **layout)
+    data = reader.SummaryData(root, on_demand=on_demand)
+    check_vectors(data, contents)
+    data.close()
+
+
+def test_full_read(reader, summary):
+    root, contents = summary
+    data = reader.SummaryData(root, on_demand=False)
+    np.testing.assert_array_equal(data.params, contents['params'])
+    # Stored as one contiguous row per vector, params being a transposed view of it
+    assert data.params.T.flags.c_contiguous and data.params.dtype == np.float32
+    np.testing.assert_array_equal(data.dfparams.to_numpy(), contents['params'])
+    assert [section.tolist() for section in data.seqhdr] == [[12345]]
+    assert [section.tolist() for section in data.ministep] == [[step] for step in range(5)]
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from conftest import corrupt
+
+
+@pytest.mark.parametrize('on_demand', [True, False])
+def test_unexpected_section(reader, summary, on_demand):
+    root, _ = summary
+
+    def rename_ministep(data):
+        position = data.find(b'MINISTEP', len(data) // 2)
+        data[position:position + 8] = b'FOOBAR  '
+        return data
+
+    corrupt(root, rename_ministep)
+    with pytest.raises(Exception, match='Unexpected section name'):
+        reader.SummaryData(root, on_demand=on_demand).vector('FOPR')
+
+
+def _scan(reader, root, change=lambda data: data, verify=True):
+    """Scan the sections of a .UNSMRY file after applying a change to its bytes"""
+    corrupt(root, change)
+    buf = np.fromfile(root + '.UNSMRY', dtype=np.uint8)
+    return reader._scan_sections(buf, reader._UNSMRY_SECTIONS, reader._RECORD_TYPE_NAMES, verify)
+
+
+def test_scan_sections(reader, summary):
+    root, contents = summary
+    kinds, types, offsets, end_offsets = _scan(reader, root)
+    # SEQHDR, then MINISTEP and PARAMS for each of the five ministeps
+    assert kinds.tolist() == [0] + [1, 2] * 5
+    assert types.tolist() == [0] + [0, 1] * 5
+    # Each section follows a 24 byte header, and the PARAMS items are framed by two block lengths
+    assert (offsets[1:] - end_offsets[:-1]).tolist() == [24] * 10
+    assert (end_offsets - offsets)[kinds == 2].tolist() == [4 + contents['params'].shape[1] * 4 + 4] * 5
+
+
+@pytest.mark.parametrize('verify, expected', [(True, -2), (False, 2)])
+def test_scan_block_length_mismatch(reader, summary, verify, expected):
+    root, _ = summary
+
+    def change_end_block_length(data):
+        data[-1] ^= 1
+        return data
+
+    kinds, _, _, _ = _scan(reader, root, change_end_block_length, verify)
+    # The end block length is only read when verifying
+    assert kinds[-1] == expected
+
+
+@pytest.mark.parametrize('cut', [4, 100, 200, 220])
+def test_scan_truncated(reader, summary, cut):
+    root, _ = summary
+    kinds, _, _, _ = _scan(reader, root, lambda data: data[:-cut])
+    assert kinds[-1] == -3
@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from conftest import write_summary
+
+
+def test_skipped_sections_read_on_first_use(reader, summary):
+    root, contents = summary
+    data = reader.SummaryData(root)
+    assert 'units_section' not in vars(data)
+    assert list(data.units_section) == contents['units']
+    assert data.runtimed_section.tolist() == [1.5, -2.25, 3.125]
+
+
+@pytest.mark.parametrize('options', [{}, {'print_smspec': True}, {'smspec_sections': {'LOGIHEAD'}}],
+                         ids=['default', 'print_smspec', 'requested'])
+def test_unknown_smspec_section(reader, tmp_path, options):
+    root = str(tmp_path / 'CASE')
+    write_summary(root, extra_sections=[('LOGIHEAD', 'LOGI', [True, False, True])])
+    with pytest.raises(Exception, match=r'Unexpected section name \(LOGIHEAD\)'):
+        reader.SummaryData(root, **options)
+
+
+def test_skipped_section_after_failed_read(reader, summary):
+    root, contents = summary
+    data = reader.SummaryData(root)
+    os.rename(root + '.SMSPEC', root + '.moved')
+    with pytest.raises(FileNotFoundError):
+        data.units_section
+    os.rename(root + '.moved', root + '.SMSPEC')
+    assert list(data.units_section) == contents['units']
+
+
+def test_skipped_section_of_changed_file(reader, summary):
+    root, _ = summary
+    data = reader.SummaryData(root)
+    stat = os.stat(root + '.SMSPEC')
+    os.utime(root + '.SMSPEC', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    with pytest.raises(Exception, match='has changed since it was read'):
+        data.units_section
+
+
+def test_print_smspec(reader, summary, capsys):
+    root, contents = summary
+    data = reader.SummaryData(root, print_smspec=True)
+    output = capsys.readouterr().out
+    assert 'Section: UNITS, expected records: {}:, record type: CHAR'.format(len(contents['units'])) in output
+    # Every section is read and printed at the start, none are left to be read on first use
+    assert 'units_section' in vars(data) and 'runtimed_section' in vars(data)
+    assert list(data.units_section) == contents['units']
+    assert data.runtimed_section.tolist() == [1.5, -2.25, 3.125]
+
+
+def test_requested_sections_read_at_start(reader, summary):
+    root, contents = summary
+    reader.SummaryData(root)
+    # The sections read at the start must not come from the earlier object for the same file
+    data = reader.SummaryData(root, smspec_sections={'UNITS', 'RUNTIMED'})
+    assert 'units_section' in vars(data) and 'runtimed_section' in vars(data)
+    assert list(data.units_section) == contents['units']
+
+
+def test_sections_reused_until_file_changes(reader, summary):
+    root, contents = summary
+    first = reader.SummaryData(root)
+    first.keywords_section[0] = 'CHANGED'
+    # Copied from the first object, without the change made through it
+    second = reader.SummaryData(root)
+    assert second.keywords_section[0] == 'TIME'
+    assert list(second.well_names) == contents['wells']
+    contents = write_summary(root, num_wells=4)
+    stat = os.stat(root + '.SMSPEC')
+    os.utime(root + '.SMSPEC', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert list(reader.SummaryData(root).well_names) == contents['wells']
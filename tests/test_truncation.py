@@ -0,0 +1,29 @@
+import pytest
+
+from conftest import corrupt
+
+
+@pytest.mark.parametrize('on_demand', [True, False])
+def test_verify_blocks(reader, summary, on_demand):
+    root, _ = summary
+
+    def change_end_block_length(data):
+        # The block length after the data of the last PARAMS section
+        data[-4:] = (int.from_bytes(data[-4:], 'big') + 1).to_bytes(4, 'big')
+        return data
+
+    corrupt(root, change_end_block_length)
+    with pytest.raises(Exception, match='not equal to end block length'):
+        reader.SummaryData(root, on_demand=on_demand, verify_blocks=True).vector('FOPR')
+
+
+@pytest.mark.parametrize('verify_blocks', [True, False])
+@pytest.mark.parametrize('on_demand', [True, False])
+@pytest.mark.parametrize('cut', [4, 100, 200, 220])
+def test_truncated_file(reader, summary, on_demand, verify_blocks, cut):
+    root, _ = summary
+    # The last PARAMS section is 196 bytes long and the MINISTEP section before it 36 bytes, so the file ends
+    # in the PARAMS end block length, PARAMS data, MINISTEP data and MINISTEP header respectively
+    corrupt(root, lambda data: data[:-cut])
+    with pytest.raises(Exception, match='Unexpected end of file'):
+        reader.SummaryData(root, on_demand=on_demand, verify_blocks=verify_blocks).vector('BPR', '4 2 3')
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from conftest import BLANK, VECTORS, write_summary
+
+
+@pytest.mark.parametrize('on_demand', [True, False])
+@pytest.mark.parametrize('restart_seqhdr', [False, True], ids=['regular', 'restart'])
+def test_vectors_match_vector(reader, tmp_path, on_demand, restart_seqhdr):
+    root = str(tmp_path / 'CASE')
+    write_summary(root, restart_seqhdr=restart_seqhdr)
+    data = reader.SummaryData(root, on_demand=on_demand)
+    pairs = [pair for pair, _, _ in VECTORS] + [('FOPR', '')]
+    frame = data.vectors(pairs)
+    assert list(frame.columns) == ['{}:{}'.format(*pair) for pair in pairs]
+    # FOPR is requested twice, so the columns are compared by position
+    for position, pair in enumerate(pairs):
+        np.testing.assert_array_equal(frame.iloc[:, position].to_numpy(), data.vector(*pair).to_numpy())
+
+
+@pytest.mark.parametrize('on_demand', [True, False])
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_dtype(reader, summary, on_demand, dtype):
+    root, contents = summary
+    data = reader.SummaryData(root, on_demand=on_demand)
+    expected = contents['params'][:, contents['index'][('RWFT', BLANK, 1 + 32768 * 12)]].astype(dtype)
+    vector = data.vector('RWFT', '2 1', dtype=dtype)
+    assert vector.dtype == dtype
+    np.testing.assert_array_equal(vector.to_numpy(), -expected)
+    frame = data.vectors([('RWFT', '1 2'), ('RWFT', '2 1')], dtype=dtype)
+    assert list(frame.dtypes) == [dtype, dtype]
+    np.testing.assert_array_equal(frame.to_numpy(), np.stack([expected, -expected], axis=1))
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-# Used to convert bytes to double
+# Used to convert bytes to integers
 import struct
 
 # Used to convert a set of integers to date
@@ -13,6 +13,537 @@ import pandas as pd
 # Used for stripping extension from filename
 import os.path
 
+# Used to convert blocks of bytes to numbers in a single call
+import numpy as np
+
+# Used to map the .UNSMRY file into memory for on-demand reads
+import mmap
+
+# Used to recognise a damaged cache archive
+import zipfile
+
+# Used to compile the loops which step through the blocks of a file, and to gather vector items in parallel,
+# if it is installed
+try:
+    from numba import njit, prange
+    _NUMBA = True
+except ImportError:
+    _NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when numba is not installed, which leaves the function as plain python"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+    prange = range
+
+# Precompiled format for the big-endian block lengths, avoiding parsing the format on each read
+_INT32 = struct.Struct('>i')
+
+# Precompiled format for a whole section header: block length, section name, number of records, record type
+# and the block length repeated at the end
+_HEADER = struct.Struct('>i8si4si')
+
+# The numpy data type of the items of each record type, including byte order
+_DTYPES = {'INTE': '>i4', 'REAL': '>f4', 'DOUB': '>f8', 'CHAR': 'S8', 'LOGI': '>i4'}
+
+# Files larger than this size in bytes are mapped into memory rather than read in a single call
+_MAP_SIZE = 100 * 1024 * 1024
+
+# .SMSPEC sections needed to describe the vectors, always read whichever other sections are requested
+_REQUIRED_SECTIONS = {'DIMENS', 'STARTDAT', 'KEYWORDS', 'WGNAMES', 'NUMS'}
+
+# Every .SMSPEC section that can be read, any other section name is reported as unexpected
+_SMSPEC_SECTIONS = frozenset(['INTEHEAD', 'RESTART', 'DIMENS', 'STARTDAT', 'RUNTIMEI', 'RUNTIMED', 'KEYWORDS',
+                              'WGNAMES', 'NUMS', 'MEASRMNT', 'UNITS', 'LGRS', 'NUMLX', 'NUMLY', 'NUMLZ'])
+
+# .SMSPEC sections already read in this process, keyed by file path, modification time, verify_blocks and the
+# sections read at the start, so that opening the same summary file again does not parse the .SMSPEC file again
+_SMSPEC_CACHE = dict()
+_SMSPEC_CACHE_SIZE = 32
+
+# Special keywords that do not follow usual pattern of first letters
+_SPECIAL_KEYWORDS = frozenset(['TIME', 'YEARS', 'DAY', 'MONTH', 'YEAR', 'ELAPSED', 'MAXDPR', 'MAXDSO', 'MAXDSG',
+                               'MAXDSW', 'NEWTON', 'NLINEARS', 'STEPTYPE',
+                               'TCPU', 'TCPUTS', 'TCPUDAY', 'TELAPTS', 'TELAPDAY', 'TIMESTEP'])
+
+# The sections found in a .UNSMRY file, one row of 8 bytes per name, PARAMS being row 2
+_UNSMRY_SECTIONS = np.frombuffer(b'SEQHDR  MINISTEPPARAMS  ', dtype=np.uint8).reshape(3, 8)
+
+# The record types, numbered in the order of _DTYPES for use in compiled code, one row of 4 bytes per type
+_RECORD_TYPES = tuple(_DTYPES)
+_RECORD_TYPE_NAMES = np.frombuffer(''.join(_RECORD_TYPES).encode(), dtype=np.uint8).reshape(-1, 4)
+
+# Returned in place of the end block length when the file ends part way through a block
+_TRUNCATED = -1
+
+
+@njit(cache=True)
+def _read_block_length(buf, offset):
+    """Read one big-endian block length from the .SMSPEC or .UNSMRY file
+
+    Parameters:
+        buf (ndarray): The contents of the .SMSPEC or .UNSMRY file
+        offset (int):  The position of the block length in the file
+
+    Returns:
+        int : The block length
+
+    """
+    return ((np.int64(buf[offset]) << 24) | (np.int64(buf[offset + 1]) << 16)
+            | (np.int64(buf[offset + 2]) << 8) | np.int64(buf[offset + 3]))
+
+
+@njit(cache=True)
+def _walk_blocks(buf, offset, num_records, type_length, verify):
+    """Step over the blocks of one section using only the block lengths
+
+    Parameters:
+        buf (ndarray):      The contents of the .SMSPEC or .UNSMRY file
+        offset (int):       The position of the start of the section in the file
+        num_records (int):  The number of records in the section
+        type_length (int):  The length in bytes of one item
+        verify (bool):      Flag for whether to read the block length at the end of each block
+
+    Returns:
+        Tuple: (offset, block_length, end_block_length)
+        offset (int):           The position in the file immediately after the last block read
+        block_length (int):     The length at the start of the last block read
+        end_block_length (int): The length at the end of the last block read, which differs from block_length
+                                    if the file is corrupt, in which case the walk stops at that block.
+                                    Equal to block_length when verify is False. _TRUNCATED if the file ends
+                                    part way through the block, in which case offset is the start of the block
+
+    """
+    block_length = 0
+    end_block_length = 0
+    i = 0
+    while i < num_records:
+        # The whole block, including both block lengths, must be inside the file whether or not it is verified
+        if offset + 4 > buf.size:
+            return offset, block_length, _TRUNCATED
+        block_length = _read_block_length(buf, offset)
+        if offset + block_length + 8 > buf.size:
+            return offset, block_length, _TRUNCATED
+        offset += 4
+        num_items = block_length // type_length
+        offset += block_length
+        if verify:
+            end_block_length = _read_block_length(buf, offset)
+        else:
+            end_block_length = block_length
+        offset += 4
+        if block_length != end_block_length or num_items == 0:
+            break
+        i += num_items
+    return offset, block_length, end_block_length
+
+
+@njit(cache=True)
+def _grow(array, size):
+    """Copy an array into a new, larger array
+
+    Parameters:
+        array (ndarray): The array to be copied
+        size (int):      The length of the new array
+
+    Returns:
+        ndarray : The new array, with the contents of the old array at the start
+
+    """
+    result = np.empty(size, dtype=array.dtype)
+    result[:array.size] = array
+    return result
+
+
+@njit(cache=True)
+def _find_blocks(buf, offset, num_records, type_length, verify):
+    """Step over the blocks of one section using only the block lengths, finding the data in each block
+
+    Parameters:
+        buf (ndarray):      The contents of the .SMSPEC or .UNSMRY file
+        offset (int):       The position of the start of the section in the file
+        num_records (int):  The number of records in the section
+        type_length (int):  The length in bytes of one item
+        verify (bool):      Flag for whether to read the block length at the end of each block
+
+    Returns:
+        Tuple: (starts, lengths, offset, block_length, end_block_length)
+        starts (ndarray):       The position of the data in each block
+        lengths (ndarray):      The length in bytes of the data in each block
+        offset (int):           The position in the file immediately after the last block read
+        block_length (int):     The length at the start of the last block read
+        end_block_length (int): The length at the end of the last block read, as for _walk_blocks()
+
+    """
+    starts = np.empty(16, dtype=np.int64)
+    lengths = np.empty(16, dtype=np.int64)
+    num_blocks = 0
+    block_length = 0
+    end_block_length = 0
+    i = 0
+    while i < num_records:
+        if num_blocks == starts.size:
+            starts = _grow(starts, 2 * num_blocks)
+            lengths = _grow(lengths, 2 * num_blocks)
+        if offset + 4 > buf.size:
+            end_block_length = _TRUNCATED
+            break
+        block_length = _read_block_length(buf, offset)
+        if offset + block_length + 8 > buf.size:
+            end_block_length = _TRUNCATED
+            break
+        starts[num_blocks] = offset + 4
+        lengths[num_blocks] = block_length
+        num_blocks += 1
+        offset += 4 + block_length
+        if verify:
+            end_block_length = _read_block_length(buf, offset)
+        else:
+            end_block_length = block_length
+        offset += 4
+        num_items = block_length // type_length
+        if block_length != end_block_length or num_items == 0:
+            break
+        i += num_items
+    return starts[:num_blocks], lengths[:num_blocks], offset, block_length, end_block_length
+
+
+@njit(cache=True)
+def _join_blocks(buf, starts, lengths):
+    """Copy the data of a set of blocks into one array
+
+    Parameters:
+        buf (ndarray):     The contents of the .SMSPEC or .UNSMRY file
+        starts (ndarray):  The position of the data in each block
+        lengths (ndarray): The length in bytes of the data in each block
+
+    Returns:
+        ndarray : The bytes of the blocks, one after the other, in the byte order of the file
+
+    """
+    result = np.empty(lengths.sum(), dtype=np.uint8)
+    position = 0
+    for k in range(starts.size):
+        result[position:position + lengths[k]] = buf[starts[k]:starts[k] + lengths[k]]
+        position += lengths[k]
+    return result
+
+
+@njit(cache=True)
+def _scan_sections(buf, names, type_names, verify):
+    """Step through the sections of the .UNSMRY file using only the section headers and block lengths
+
+    Parameters:
+        buf (ndarray):        The contents of the .UNSMRY file
+        names (ndarray):      The expected section names, one row of 8 bytes per name, PARAMS being row 2
+        type_names (ndarray): The record types, one row of 4 bytes per type
+        verify (bool):        Flag for whether to read the block length at the end of each block
+
+    Returns:
+        Tuple: (kinds, types, offsets, end_offsets)
+        kinds (ndarray):       The row of names matching each section. The scan stops at the first section with
+                                    -1, an unexpected name, -2, block lengths at the start and end not matching,
+                                    or -3, the file ending part way through the section
+        types (ndarray):       The row of type_names matching the record type of each section, or -1 if unknown
+        offsets (ndarray):     The position of the first block of each section
+        end_offsets (ndarray): The position in the file immediately after each section
+
+    """
+    kinds = np.empty(1024, dtype=np.int64)
+    types = np.empty(1024, dtype=np.int64)
+    offsets = np.empty(1024, dtype=np.int64)
+    end_offsets = np.empty(1024, dtype=np.int64)
+    count = 0
+    offset = 0
+    while offset < buf.size:
+        if count == kinds.size:
+            kinds = _grow(kinds, 2 * count)
+            types = _grow(types, 2 * count)
+            offsets = _grow(offsets, 2 * count)
+            end_offsets = _grow(end_offsets, 2 * count)
+        if offset + 24 > buf.size:
+            # The file ends part way through the section header
+            kinds[count] = -3
+            types[count] = -1
+            offsets[count] = offset + 24
+            end_offsets[count] = offset + 24
+            count += 1
+            break
+        kind = -1
+        for k in range(names.shape[0]):
+            if np.all(buf[offset + 4:offset + 12] == names[k]):
+                kind = k
+                break
+        record_type = -1
+        for k in range(type_names.shape[0]):
+            if np.all(buf[offset + 16:offset + 20] == type_names[k]):
+                record_type = k
+                break
+        num_records = _read_block_length(buf, offset + 12)
+        # DOUB and CHAR items are 8 bytes long, the other types 4 bytes
+        type_length = 8 if buf[offset + 16] == ord('D') or buf[offset + 16] == ord('C') else 4
+        if _read_block_length(buf, offset) != _read_block_length(buf, offset + 20):
+            kind = -2
+        offset += 24
+        end_offset = offset
+        if kind >= 0:
+            end_offset, block_length, end_block_length = _walk_blocks(buf, offset, num_records, type_length, verify)
+            if end_block_length == _TRUNCATED:
+                kind = -3
+            elif block_length != end_block_length:
+                kind = -2
+        kinds[count] = kind
+        types[count] = record_type
+        offsets[count] = offset
+        end_offsets[count] = end_offset
+        count += 1
+        if kind < 0:
+            break
+        offset = end_offset
+    return kinds[:count], types[:count], offsets[:count], end_offsets[:count]
+
+
+@njit(cache=True)
+def _join_sections(buf, offsets, end_offsets):
+    """Copy the data of a set of sections into one array, using only the block lengths
+
+    Parameters:
+        buf (ndarray):         The contents of the .UNSMRY file
+        offsets (ndarray):     The position of the first block of each section
+        end_offsets (ndarray): The position in the file immediately after each section
+
+    Returns:
+        Tuple: (data, lengths)
+        data (ndarray):    The bytes of the sections, one after the other, in the byte order of the file
+        lengths (ndarray): The length in bytes of the data of each section
+
+    """
+    data = np.empty((end_offsets - offsets).sum(), dtype=np.uint8)
+    lengths = np.zeros(offsets.size, dtype=np.int64)
+    position = 0
+    for k in range(offsets.size):
+        offset = offsets[k]
+        while offset < end_offsets[k]:
+            block_length = _read_block_length(buf, offset)
+            data[position:position + block_length] = buf[offset + 4:offset + 4 + block_length]
+            position += block_length
+            lengths[k] += block_length
+            offset += block_length + 8
+    return data[:position], lengths
+
+
+@njit(parallel=True, cache=True)
+def _gather_items(buf, item_offsets, item_length):
+    """Copy the bytes of one item from each of a set of positions in the .UNSMRY file, in parallel
+
+    Parameters:
+        buf (ndarray):          The contents of the .UNSMRY file
+        item_offsets (ndarray): The position of each item in the file
+        item_length (int):      The length in bytes of one item
+
+    Returns:
+        ndarray : The bytes of the items, one after the other, in the byte order of the file
+
+    """
+    result = np.empty(item_offsets.size * item_length, dtype=np.uint8)
+    for t in prange(item_offsets.size):
+        for k in range(item_length):
+            result[t * item_length + k] = buf[item_offsets[t] + k]
+    return result
+
+
+def _map_file(filename, advice=None):
+    """Map a file into memory as a read-only array of bytes. The file itself is closed straight away,
+        the mapping stays open until the array and any views of it are deleted.
+
+    Parameters:
+        filename (string): The name of the file
+        advice (int):      The mmap.MADV_* value describing how the file will be read, passed on to the
+                                operating system where supported (default=None)
+
+    Returns:
+        ndarray: The contents of the file as an array of bytes
+
+    """
+    with open(filename, 'rb') as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if advice is not None:
+        mapping.madvise(advice)
+    return np.frombuffer(mapping, dtype=np.uint8)
+
+
+class _VectorCatalog:
+    """The position of each vector in the PARAMS sections of the .UNSMRY file, looked up by keyword and identifier
+
+    Parameters:
+        keywords (list):    The contents of the keywords section from the .SMSPEC file
+        wgnames (list):     The contents of the wgnames section from the .SMSPEC file, with blanks removed
+        nums (list):        The contents of the nums section from the .SMSPEC file
+        nx (int):           Grid NX
+        ny (int):           Grid NY
+
+    Attributes:
+        nxy (int):                     Number of cells in each layer of the grid, NX * NY
+        by_keyword (dict):             The position of each keyword
+        by_keyword_wgname (dict):      The position of each (keyword, well/group name) pair
+        by_keyword_num (dict):         The position of each (keyword, NUMS) pair
+        by_keyword_wgname_num (dict):  The position of each (keyword, well/group name, NUMS) triple
+
+    Methods:
+        find(keyword, identifier):     Return the position of a vector and the sign it is stored with
+
+    """
+
+    def __init__(self, keywords, wgnames, nums, nx, ny):
+        """Builds the lookups in a single pass over the .SMSPEC sections"""
+        self.nx = nx
+        self.ny = ny
+        # Number of cells in each layer, used to calculate block data cell indices
+        self.nxy = nx * ny
+        # Each lookup keeps the first occurrence of its key
+        self.by_keyword = dict()
+        self.by_keyword_wgname = dict()
+        self.by_keyword_num = dict()
+        self.by_keyword_wgname_num = dict()
+        for i, (keyword, wgname, num) in enumerate(zip(keywords, wgnames, np.asarray(nums).tolist())):
+            self.by_keyword.setdefault(keyword, i)
+            self.by_keyword_wgname.setdefault((keyword, wgname), i)
+            self.by_keyword_num.setdefault((keyword, num), i)
+            self.by_keyword_wgname_num.setdefault((keyword, wgname, num), i)
+
+    def find(self, keyword, identifier=''):
+        """Find the position of a vector in the PARAMS sections of the .UNSMRY file
+
+        Parameters:
+            keyword (string):    The vector to find
+            identifier (string): The identifier (well/group, etc) for the vector, as accepted by vector()
+
+        Returns:
+            Tuple: (index, sign_mult)
+            index (int):     The index of the vector in the PARAMS sections
+            sign_mult (int): -1 if the vector is stored with the opposite sign (reversed region flows), else 1
+
+        Raises:
+            Exception:  if the keyword is not supported
+            ValueError: if the vector is not found
+
+        """
+        # Look up keyword and identifier depending on vector type
+
+        sign_mult = 1
+
+        if keyword in _SPECIAL_KEYWORDS:
+            i = self.__lookup(self.by_keyword, keyword)
+
+        elif keyword[0] == 'A':  # Aquifer
+            i = self.__lookup(self.by_keyword_num, (keyword, identifier))
+
+        elif keyword[0] == 'B':  # Block data
+            # "Cell index, calculated from the natural position as (IZ-1)*NX*NY+(IY-1)*NX+IX"
+            #       - Eclipse File Formats Reference Manual
+            block_ix, block_iy, block_iz = identifier.split()
+            block_index = ((int(block_iz) - 1) * self.nxy) + ((int(block_iy) - 1) * self.nx) + int(block_ix)
+            i = self.__lookup(self.by_keyword_num, (keyword, block_index))
+
+        elif keyword[0] == 'C':  # Completion or connection data
+            well_name, connection_number = tuple(identifier.split())
+            i = self.__lookup(self.by_keyword_wgname_num, (keyword, well_name, int(connection_number)))
+
+        elif keyword[0] == 'E':  # Edge data produced by the FrontSim GEOFLOFS option or the ELAPSED keyword
+            i = self.__lookup(self.by_keyword, keyword)
+
+        elif keyword[0] == 'F':  # Field data
+            i = self.__lookup(self.by_keyword, keyword)
+
+        elif keyword[0] == 'G':  # Group data
+            i = self.__lookup(self.by_keyword_wgname, (keyword, identifier))
+
+        elif keyword[0:2] == 'LB':  # Local grid block data
+            raise Exception(
+                'Keywords starting LB for Local grid block data not currently supported ({})'.format(keyword))
+
+        elif keyword[0:2] == 'LC':  # Local grid completion or connection data
+            raise Exception(
+                'Keywords starting LC for Local grid completion or connection data not currently supported ({})'.format(
+                    keyword))
+
+        elif keyword[0:2] == 'LW':  # Local grid well data
+            raise Exception(
+                'Keywords starting LW for Local grid well data not currently supported ({})'.format(keyword))
+
+        elif keyword[0] == 'N':  # Network node or network general data
+            i = self.__lookup(self.by_keyword_wgname, (keyword, identifier))
+
+        elif keyword[0] == 'P':  # Network branch (or “pipe”) data
+            i = self.__lookup(self.by_keyword_wgname, (keyword, identifier))
+
+        elif keyword[0] == 'R' and keyword[2] == 'F':  # Region to region flows
+            # "Combined region number calculated as IR1 + 32768*(IR2+10) where flow is from IR1 to IR2"
+            #       - Eclipse File Formats Reference Manual
+            region_num1, region_num2 = tuple(identifier.split())
+            combined_region_number_1 = int(region_num1) + (32768 * (int(region_num2) + 10))
+            combined_region_number_2 = int(region_num2) + (32768 * (int(region_num1) + 10))
+            if (keyword, combined_region_number_1) in self.by_keyword_num:
+                i = self.by_keyword_num[(keyword, combined_region_number_1)]
+            elif (keyword, combined_region_number_2) in self.by_keyword_num:
+                i = self.by_keyword_num[(keyword, combined_region_number_2)]
+                sign_mult = -1
+            else:
+                raise ValueError('No result found for identifier {}, '
+                                 '(NUMS {} or {})'.format(identifier,
+                                                          combined_region_number_1,
+                                                          combined_region_number_2))
+
+        elif keyword[0:2] == 'RC' and keyword[3] == 'M':  # Region with a component number
+            # "Combined region and component number calculated as IR + 32768*(IC+10)"
+            #       - Eclipse File Formats Reference Manual
+            region_num, comp_num = tuple(identifier.split())
+            combined_region_comp_number = int(region_num) + (32768 * (int(comp_num) + 10))
+            i = self.__lookup(self.by_keyword_num, (keyword, combined_region_comp_number))
+
+        elif keyword[0] == 'R':  # Region data
+            # "Identifier: NUMS keyword. Optional WNAMES (or NAMES *) keyword
+            #   for simulators that support named regions."
+            #    - Eclipse File Formats Reference Manual
+            #      Possible this may need modification to be compatible with
+            #      WNAMES for Intersect if it supports named regions
+            i = self.__lookup(self.by_keyword_num, (keyword, identifier))
+
+        elif keyword[0] == 'S':  # Well segment data
+            # "Well segment vectors require the well name and the segment number;
+            #   other vectors beginning with S require no additional data"
+            #       - Eclipse File Formats Reference Manual
+            #           Not sure what 'other vectors' this refers to - need to be careful about this
+            well_name, segment_number = tuple(identifier.split())
+            i = self.__lookup(self.by_keyword_wgname_num, (keyword, well_name, int(segment_number)))
+
+        elif keyword[0] == 'W':  # Well or completion data
+            i = self.__lookup(self.by_keyword_wgname, (keyword, identifier))
+
+        else:
+            raise Exception('Unexpected keyword first letter ({}) in keyword {}'.format(keyword[0], keyword))
+
+        return i, sign_mult
+
+    def __lookup(self, index, key):
+        """Look up the position of a vector in one of the lookups
+
+        Parameters:
+            index (dict): The lookup to use
+            key (tuple):  The keyword and identifiers of the vector
+
+        Returns:
+            int : The index of the vector in the PARAMS sections
+
+        Raises:
+            ValueError: if the vector is not in the summary data
+
+        """
+        if key not in index:
+            raise ValueError('No result found for {}'.format(key))
+        return index[key]
+
 
 class SummaryData:
     """An object which represents one Eclipse summary file 
@@ -25,6 +556,12 @@ class SummaryData:
                                     well/group names, units, etc to be viewed
         print_unsmry:           Results can be printed, however, this is not a useful way of viewing the data
                                     as there is usually a large amount
+        verify_blocks:          Check the block length at the end of every data block against the length at the
+                                    start, to detect corrupt files
+        smspec_sections:        Names of the optional .SMSPEC sections to read at the start, others are read
+                                    the first time their attribute is used
+        use_cache:              Keep a copy of the summary data in a numpy file next to the summary file,
+                                    which is reloaded instead of reading the summary file while it is current
 
     Attributes:
         nlist (int):                    Number of data vector parameters stored at each timestep
@@ -32,14 +569,18 @@ class SummaryData:
         well_names (list, strings):     A list of the unique well names available in summary file
         group_names (list, strings):    A list of the unique group names available in summary file
         vector_names (list, strings):   A list of the unique vector names available in summary file
+        dfparams (dataframe):           A dataframe containing the summary data, one column per vector
     
     Methods:
         vector(keyword, identifier):    Return a single vector from the summary data, either from data read in
                                             using __read_unsmry() or else directly from .unsmry file
+        vectors(pairs):                 Return several vectors from the summary data as a dataframe
+        close():                        Release the mapping of the .UNSMRY file used for on-demand reads
                                                     
     """
 
-    def __init__(self, root_name, on_demand=True, print_smspec=False, print_unsmry=False):
+    def __init__(self, root_name, on_demand=True, print_smspec=False, print_unsmry=False, verify_blocks=False,
+                 smspec_sections=None, use_cache=False):
         """Initialises the SummaryData object and processes the SMSPEC file
 
         Parameters:
@@ -50,12 +591,30 @@ class SummaryData:
                                         This can result in a large amount of information printed. (default=False)
             print_unsmry (bool):	Flag for whether to print the data read from the .UNSMRY file.
                                         This can result in a large amount of information printed. (default=False)
+            verify_blocks (bool):	Flag for whether to check that the block lengths at the start and end of each
+                                        data block match. Only needed to detect corrupt files. (default=False)
+            smspec_sections (set):	Names of the .SMSPEC sections to read at the start, e.g. {'UNITS'}. DIMENS,
+                                        STARTDAT, KEYWORDS, WGNAMES and NUMS are always read, any other section
+                                        is skipped and read the first time its attribute (e.g. units_section)
+                                        is used. All sections are read if print_smspec is set. (default=None)
+            use_cache (bool):		Flag for whether to cache the whole summary file in root_name.UNSMRY.npy
+                                        and root_name.SMSPEC.npz, and reload from them when they are newer than
+                                        the summary file. Only used when on_demand is False. (default=False)
 
         Attributes:
             SMSPECfile (string): The name of the .SMSPEC file
             UNSMRYfile (string): The name of the .UNSMRY file
+            __cache_files (tuple): The names of the cached summary data and .SMSPEC sections
+            verify_blocks (bool): Flag for whether to check the block length at the end of each data block
+            __smspec_sections (set): The .SMSPEC sections to read, or None to read all of them
+            __skipped_sections (dict): The position, number of records and record type of each skipped section
+            __smspec_mtime (float): The modification time of the .SMSPEC file when it was read, so that skipped
+                                    sections are only read from the same file
             __on_demand (bool):  Flag determining whether to read vectors individually from .unsmry file
                                     or read in whole summary file
+            __unsmry_map (ndarray): The .UNSMRY file mapped into memory, kept for repeated on-demand reads
+            __params_offsets (ndarray): The position of each PARAMS section in the .UNSMRY file,
+                                    found on the first on-demand read
         """
 
         # strip extension from filename
@@ -63,15 +622,63 @@ class SummaryData:
 
         self.SMSPECfile = root_name + '.SMSPEC'
         self.UNSMRYfile = root_name + '.UNSMRY'
+        self.__cache_files = (root_name + '.UNSMRY.npy', root_name + '.SMSPEC.npz')
+
+        # Flag for whether to check the block length at the end of each data block, by default set to False
+        self.verify_blocks = verify_blocks
 
-        self.__read_smspec(print_results=print_smspec)
-        self.__process_smspec()
+        if print_smspec:
+            self.__smspec_sections = None
+        else:
+            self.__smspec_sections = _REQUIRED_SECTIONS | set(smspec_sections or ())
+        self.__skipped_sections = dict()
 
         # Flag for whether to load results on demand, by default set to True
         self.__on_demand = on_demand
+        self.__unsmry_map = None
+        self.__params_offsets = None
+        self.__params_block_items = None
+        self.__columns = None
+        self.__dfparams = None
+
+        use_cache = use_cache and not on_demand
+        self.__smspec_mtime = os.path.getmtime(self.SMSPECfile)
+        if use_cache and self.__cache_is_current() and self.__load_cache():
+            self.__process_smspec()
+        else:
+            if print_smspec:
+                self.__read_smspec(print_results=print_smspec)
+            else:
+                self.__read_smspec_cached()
+            self.__process_smspec()
+            if not self.__on_demand:
+                self.__read_unsmry(print_results=print_unsmry)
+                if use_cache:
+                    self.__save_cache()
 
-        if not self.__on_demand:
-            self.__read_unsmry(print_results=print_unsmry)
+    def __read_smspec_cached(self):
+        """Copy the .SMSPEC sections from an earlier object for the same, unchanged, file if there is one,
+            otherwise read the .SMSPEC file and keep its sections for later objects
+
+        Attributes:
+            The .SMSPEC sections as set by __read_smspec()
+
+        """
+        key = (os.path.realpath(self.SMSPECfile), self.__smspec_mtime, self.verify_blocks,
+               frozenset(self.__smspec_sections))
+        if key in _SMSPEC_CACHE:
+            sections, skipped_sections = _SMSPEC_CACHE[key]
+            # Copies, so that changes made through one object do not affect the others
+            for name, value in sections.items():
+                setattr(self, name, value.copy())
+            self.__skipped_sections = dict(skipped_sections)
+            return
+        self.__read_smspec()
+        if len(_SMSPEC_CACHE) >= _SMSPEC_CACHE_SIZE:
+            # Dictionaries keep insertion order, so this removes the oldest file
+            del _SMSPEC_CACHE[next(iter(_SMSPEC_CACHE))]
+        sections = {name: value.copy() for name, value in vars(self).items() if name.endswith('_section')}
+        _SMSPEC_CACHE[key] = (sections, dict(self.__skipped_sections))
 
     def __read_smspec(self, print_results=False):
         """Read the .SMSPEC file which includes information about the model and the expected
@@ -140,55 +747,90 @@ class SummaryData:
             
         """
 
-        with open(self.SMSPECfile, "rb") as f:
-            while True:
-                section_name, num_records, record_type = self.__read_block_header(f)
+        buf = self.__open(self.SMSPECfile)
+        offset = 0
+        while True:
+            section_name, num_records, record_type, offset = self.__read_block_header(buf, offset)
+            if print_results:
+                print('Section: {}, expected records: {}:, record type: {}'.format(section_name, num_records,
+                                                                                   record_type))
+
+            if section_name and section_name not in _SMSPEC_SECTIONS:
+                # Checked before any section is skipped, so that every file is checked the same way
+                raise Exception('Unexpected section name ({})'.format(section_name))
+            elif section_name and self.__smspec_sections is not None and section_name not in self.__smspec_sections:
+                # Step over the blocks of a section that is not needed yet, keeping its position for __getattr__
+                self.__skipped_sections[section_name] = (offset, num_records, record_type)
+                offset = self.__skip_record(buf, offset, num_records, record_type)
+            elif section_name == 'INTEHEAD':
+                self.intehead_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'RESTART':
+                self.restart_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'DIMENS':
+                self.dimens_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'STARTDAT':
+                self.startdat_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'RUNTIMEI':
+                self.runtimei_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'RUNTIMED':
+                self.runtimed_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'KEYWORDS':
+                self.keywords_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'WGNAMES':
+                # Ensure that blank strings ':+:+:+:+' are removed
+                wgnames_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+                wgnames_section = np.array(wgnames_section, dtype='U8')
+                self.wgnames_section = np.where(wgnames_section == ':+:+:+:+', '', wgnames_section).tolist()
+            elif section_name == 'NUMS':
+                self.nums_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'MEASRMNT':
+                self.measrmnt_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'UNITS':
+                self.units_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'LGRS':
+                self.lgrs_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'NUMLX':
+                self.numlx_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'NUMLY':
+                self.numly_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == 'NUMLZ':
+                self.numlz_section, offset = self.__read_record(buf, offset, num_records, record_type, print_results)
+            elif section_name == '':
                 if print_results:
-                    print('Section: {}, expected records: {}:, record type: {}'.format(section_name, num_records,
-                                                                                       record_type))
-
-                if section_name == 'INTEHEAD':
-                    self.intehead_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'RESTART':
-                    self.restart_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'DIMENS':
-                    self.dimens_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'STARTDAT':
-                    self.startdat_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'RUNTIMEI':
-                    self.runtimei_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'RUNTIMED':
-                    self.runtimed_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'KEYWORDS':
-                    self.keywords_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'WGNAMES':
-                    # Ensure that blank strings ':+:+:+:+' are removed
-                    self.wgnames_section = [w.replace(':+:+:+:+', '') for w in self.__read_record(f,
-                                                                                                  num_records,
-                                                                                                  record_type,
-                                                                                                  print_results)]
-                elif section_name == 'NUMS':
-                    self.nums_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'MEASRMNT':
-                    self.measrmnt_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'UNITS':
-                    self.units_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'LGRS':
-                    self.lgrs_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'NUMLX':
-                    self.numlx_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'NUMLY':
-                    self.numly_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == 'NUMLZ':
-                    self.numlz_section = self.__read_record(f, num_records, record_type, print_results)
-                elif section_name == '':
-                    if print_results:
-                        print('End of file reached')
-                    break
-                else:
-                    raise Exception('Unexpected section name ({})'.format(section_name))
+                    print('End of file reached')
+                break
         return
 
+    def __getattr__(self, name):
+        """Read a .SMSPEC section that was skipped by __read_smspec() the first time its attribute is used
+
+        Parameters:
+            name (string): The name of the attribute, e.g. units_section
+
+        Returns:
+            list or ndarray: Contents of the section
+
+        Raises:
+            AttributeError: if the attribute is not a skipped .SMSPEC section
+            Exception:      if the .SMSPEC file has changed since it was first read
+
+        """
+        # Looked up in the instance dictionary, as this is also called before __skipped_sections is set
+        skipped_sections = vars(self).get('_SummaryData__skipped_sections', {})
+        section_name = name[:-len('_section')].upper()
+        if not name.endswith('_section') or section_name not in skipped_sections:
+            raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+        offset, num_records, record_type = skipped_sections[section_name]
+        if os.path.getmtime(self.SMSPECfile) != self.__smspec_mtime:
+            raise Exception('{} has changed since it was read, so the {} section can no longer be '
+                            'read'.format(self.SMSPECfile, section_name))
+        section_results, _ = self.__read_record(self.__open(self.SMSPECfile), offset, num_records, record_type,
+                                                False)
+        # Only forgotten once read, so that a failed read can be repeated
+        del skipped_sections[section_name]
+        setattr(self, name, section_results)
+        return section_results
+
     def __process_smspec(self):
         """Create start_date which is the simulation start date and nlist which contains the information
             from the dimensions section of the .SMSPEC file
@@ -205,469 +847,631 @@ class SummaryData:
             well_names (list, strings):  A list of the unique well names available in summary file
             group_names (list, strings): A list of the unique group names available in summary file
             vector_names (list, strings):A list of the unique vector names available in summary file
+            __catalog (_VectorCatalog):  The position of each vector in the summary data
 
         """
-        self.nlist = self.dimens_section[0]
-        self.nx = self.dimens_section[1]
-        self.ny = self.dimens_section[2]
-        self.nz = self.dimens_section[3]
-        self.start_date = datetime.datetime(day=self.startdat_section[0],
-                                            month=self.startdat_section[1],
-                                            year=self.startdat_section[2],
-                                            hour=self.startdat_section[3],
-                                            minute=self.startdat_section[4],
+        self.nlist = int(self.dimens_section[0])
+        self.nx = int(self.dimens_section[1])
+        self.ny = int(self.dimens_section[2])
+        self.nz = int(self.dimens_section[3])
+        startdat = [int(x) for x in self.startdat_section]
+        self.start_date = datetime.datetime(day=startdat[0],
+                                            month=startdat[1],
+                                            year=startdat[2],
+                                            hour=startdat[3],
+                                            minute=startdat[4],
                                             # Eclipse does not give seconds, datetime does not accept
                                             # microseconds > 999999, so split to seconds and microseconds
-                                            second=self.startdat_section[5] // 1000000,
-                                            microsecond=self.startdat_section[5] % 1000000
+                                            second=startdat[5] // 1000000,
+                                            microsecond=startdat[5] % 1000000
                                             )
-        self.well_names = list()
-        self.group_names = list()
-        self.vector_names = list()
-        for keyword, wgname in list(zip(self.keywords_section, self.wgnames_section)):
-            if keyword[0] == 'W' and wgname not in self.well_names:
-                self.well_names.append(wgname)
-            elif keyword[0] == 'G' and wgname not in self.group_names:
-                self.group_names.append(wgname)
-            if keyword not in self.vector_names:
-                self.vector_names.append(keyword)
+        # Dictionary keys are unique and keep the order of first appearance
+        well_names = dict()
+        group_names = dict()
+        for keyword, wgname in zip(self.keywords_section, self.wgnames_section):
+            if keyword[0] == 'W':
+                well_names[wgname] = None
+            elif keyword[0] == 'G':
+                group_names[wgname] = None
         # Remove any empty strings
-        self.well_names = [x for x in self.well_names if x != '']
-        self.group_names = [x for x in self.group_names if x != '']
-        self.vector_names = [x for x in self.vector_names if x != '']
+        self.well_names = [x for x in well_names if x]
+        self.group_names = [x for x in group_names if x]
+        self.vector_names = [x for x in dict.fromkeys(self.keywords_section) if x]
+        # Lookups of the position of each vector by the combinations of identifiers used by vector()
+        self.__catalog = _VectorCatalog(self.keywords_section, self.wgnames_section, self.nums_section,
+                                        self.nx, self.ny)
         return
 
-    def __read_block_header(self, f):
+    def __open(self, filename):
+        """Load a .SMSPEC or .UNSMRY file so that it can be parsed from memory without further read calls.
+        Files up to _MAP_SIZE are read in a single call, larger files are mapped into memory and read through
+            from start to end, so that the operating system reads ahead rather than the whole file being copied.
+
+        Parameters:
+            filename (string): The name of the .SMSPEC or .UNSMRY file
+
+        Returns:
+            ndarray: The contents of the file as an array of bytes
+
+        """
+        if os.path.getsize(filename) > _MAP_SIZE:
+            return _map_file(filename, getattr(mmap, 'MADV_SEQUENTIAL', None))
+        return np.fromfile(filename, dtype=np.uint8)
+
+    def __map_unsmry(self):
+        """Map the .UNSMRY file into memory for on-demand reads. The file is mapped and its PARAMS sections
+            found on the first read only, later reads reuse the same mapping.
+
+        Returns:
+            ndarray: The contents of the .UNSMRY file as an array of bytes
+
+        """
+        if self.__unsmry_map is None:
+            # On-demand reads pick single items out of each ministep, so reading ahead is of no use
+            self.__unsmry_map = _map_file(self.UNSMRYfile, getattr(mmap, 'MADV_RANDOM', None))
+            self.__index_params(self.__unsmry_map)
+        return self.__unsmry_map
+
+    def close(self):
+        """Release the mapping of the .UNSMRY file used for on-demand reads. The file is mapped again if
+            another vector is read on demand."""
+        unsmry_map = vars(self).get('_SummaryData__unsmry_map')
+        if unsmry_map is not None:
+            self.__unsmry_map = None
+            mapping = unsmry_map.base.obj
+            del unsmry_map
+            try:
+                mapping.close()
+            except BufferError:
+                # An array still refers to the mapping, which is then released when that array is deleted
+                pass
+
+    def __del__(self):
+        """Release the mapping of the .UNSMRY file when the object is deleted"""
+        self.close()
+
+    def __read_block_header(self, buf, offset):
         """Reads a block header from the .UNSMRY file
 
         Parameters:
-            f (file): The .SMSPEC or .UNSMRY file
+            buf (ndarray): The contents of the .SMSPEC or .UNSMRY file
+            offset (int):  The position of the block header in the file
 
         Returns:
-            Tuple: (section_name, num_records, record_type)
+            Tuple: (section_name, num_records, record_type, offset)
             section_name (string): The name of the section
             num_records (int):     The number of records in the section
             record_type (string):  The data type of the data in the section
+            offset (int):          The position in the file immediately after the block header
         
         Raises:
             Exception: If the record of the block length at the start and end of a block do not match
 
         """
-        block_length = self.__read_integers(f)[0]
-        section_name = self.__read_strings(f)[0]
-        num_records = self.__read_integers(f)[0]
-        record_type = self.__read_strings_short(f)[0]
-        end_block_length = self.__read_integers(f)[0]
+        if offset >= len(buf):
+            # End of file reached, signalled to the caller by an empty section name
+            return '', 0, '', offset
+        if offset + 24 > len(buf):
+            raise Exception('Unexpected end of file in the section header at position {}.'.format(offset))
+        block_length, section_name, num_records, record_type, end_block_length = _HEADER.unpack_from(buf, offset)
+        section_name = section_name.decode(encoding='utf-8', errors='strict').strip()
+        record_type = record_type.decode(encoding='utf-8', errors='strict')
         if block_length != end_block_length:
             raise Exception('Start block length ({}) not equal to end block length ({}).'.format(block_length,
                                                                                                  end_block_length))
         else:
-            return section_name, num_records, record_type
+            return section_name, num_records, record_type, offset + 24
 
-    def __read_record(self, f, num_records, record_type, print_results):
+    def __read_record(self, buf, offset, num_records, record_type, print_results):
         """Read in one section from .SMSPEC or .UNSMRY file
         Results can be printed, allowing the contents of the current record to be viewed
 
         Parameters:
-            f (file):             The .SMSPEC or .UNSMRY file
+            buf (ndarray):        The contents of the .SMSPEC or .UNSMRY file
+            offset (int):         The position of the start of the section in the file
             num_records (int):    The number of records in the section
             record_type (string): The data type of the data in the section 
             print_results (bool): Flag for whether to print the data read from the .SMSPEC file
 
         Returns:
-            List: Contents of section
-            
+            Tuple: (section_results, offset)
+            section_results (list or ndarray): Contents of section, numeric sections are returned as a numpy array
+            offset (int):                      The position in the file immediately after the section
+
         Raises:
             Exception: If the record of the block length at the start and end of a block do not match
+                            (only checked if verify_blocks is set)
 
         """
-        section_results = list()
-        i = 1
-        while i <= num_records:
-            if print_results:
+        if record_type not in _DTYPES:
+            raise Exception('Unrecognised record type: {}.'.format(record_type))
+        dtype = np.dtype(_DTYPES[record_type])
+
+        # Find all the blocks from their lengths first, then copy their data into one array in a single call
+        starts, lengths, offset, block_length, end_block_length = _find_blocks(buf, offset, num_records,
+                                                                               dtype.itemsize, self.verify_blocks)
+        self.__check_block_lengths(offset, block_length, end_block_length)
+        if print_results:
+            for i in np.cumsum(lengths // dtype.itemsize) - lengths // dtype.itemsize + 1:
                 print('Reading record {} of {}'.format(i, num_records))
-            block = list()
-            block_length = self.__read_integers(f)[0]
-            if record_type == 'INTE':
-                block = self.__read_integers(f, block_length)
-            elif record_type == 'REAL':
-                block = self.__read_reals(f, block_length)
-            elif record_type == 'DOUB':
-                block = self.__read_doubles(f, block_length)
-            elif record_type == 'CHAR':
-                block = self.__read_strings(f, block_length)
-            elif record_type == 'LOGI':
-                block = self.__read_logis(f, block_length)
-            else:
-                raise Exception('Unrecognised record type: {}.'.format(record_type))
-            end_block_length = self.__read_integers(f)[0]
-            if block_length != end_block_length:
-                raise Exception('Start block length ({}) not equal to end block length ({}).'.format(block_length,
-                                                                                                     end_block_length))
-            i += len(block)
-            section_results += block
+        section_results = self.__decode_record(_join_blocks(buf, starts, lengths).view(dtype), record_type)
         if print_results:
             print(section_results)
-        return section_results
+        return section_results, offset
+
+    def __decode_record(self, items, record_type):
+        """Convert the items of a section from the format of the file
+
+        Parameters:
+            items (ndarray):      The items of the section, with the numpy data type from _DTYPES
+            record_type (string): The data type of the data in the section
+
+        Returns:
+            list or ndarray: The items, numeric items are returned as a numpy array
+
+        """
+        if record_type == 'CHAR':
+            return np.char.strip(items.astype('U8')).tolist()
+        if record_type == 'LOGI':
+            # True is stored as -1 (or 1 by some programs), and zero is the same in either byte order
+            return items != 0
+        # Numeric sections are returned in native byte order
+        return items.astype(items.dtype.newbyteorder('='))
 
-    def __read_record_on_demand(self, f, read_index, num_records, record_type):
-        """Read in one item from a section in .SMSPEC or .UNSMRY file, seeking past undesired data
+    def __skip_record(self, buf, offset, num_records, record_type):
+        """Step over one section in .SMSPEC or .UNSMRY file using only the block lengths
 
         Parameters:
-            f (file):             The .SMSPEC or .UNSMRY file
-            read_index (int):     The index of the vector to be read
+            buf (ndarray):        The contents of the .SMSPEC or .UNSMRY file
+            offset (int):         The position of the start of the section in the file
             num_records (int):    The number of records in the section
-            record_type (string): The data type of the data in the section 
-            print_results (bool): Flag for whether to print the data read from the .SMSPEC file
+            record_type (string): The data type of the data in the section
 
         Returns:
-            Result: Contents of requested item
-            
+            offset (int): The position in the file immediately after the section
+
         Raises:
             Exception: If the record of the block length at the start and end of a block do not match
+                            (only checked if verify_blocks is set)
 
         """
-        result = list()
-
-        if record_type in ['DOUB', 'CHAR']:
-            type_length = 8
-        else:
-            type_length = 4
-        target = read_index + 1
-
-        i = 1
-        while i <= num_records:
-            block_length = self.__read_integers(f)[0]
-            if target > (i + block_length // type_length) or target < i:
-                f.seek(block_length, 1)
-            else:
-                skip_num = (target - i) * type_length
-                if record_type == 'INTE':
-                    f.seek(skip_num, 1)
-                    result = self.__read_integers(f)
-                    f.seek((block_length - skip_num - type_length), 1)
-                elif record_type == 'REAL':
-                    f.seek(skip_num, 1)
-                    result = self.__read_reals(f)
-                    f.seek((block_length - skip_num - type_length), 1)
-                elif record_type == 'DOUB':
-                    f.seek(skip_num, 1)
-                    result = self.__read_doubles(f)
-                    f.seek((block_length - skip_num - type_length), 1)
-                elif record_type == 'CHAR':
-                    f.seek(skip_num, 1)
-                    result = self.__read_strings(f)
-                    f.seek((block_length - skip_num - type_length), 1)
-                elif record_type == 'LOGI':
-                    f.seek(skip_num, 1)
-                    result = self.__read_logis(f)
-                    f.seek((block_length - skip_num - type_length), 1)
-                else:
-                    raise Exception('Unrecognised record type: {}.'.format(record_type))
-            end_block_length = self.__read_integers(f)[0]
-            if block_length != end_block_length:
-                raise Exception('Start block length ({}) not equal to end block length ({}).'.format(block_length,
-                                                                                                     end_block_length))
-            i += block_length // type_length
-
-        return result
+        if record_type not in _DTYPES:
+            raise Exception('Unrecognised record type: {}.'.format(record_type))
+        offset, block_length, end_block_length = _walk_blocks(buf, offset, num_records,
+                                                              np.dtype(_DTYPES[record_type]).itemsize,
+                                                              self.verify_blocks)
+        self.__check_block_lengths(offset, block_length, end_block_length)
+        return offset
 
-    def __read_unsmry(self, print_results=False):
-        """Read the whole .UNSMRY file which contains the vectors described in the .SMSPEC file.
-        Results can be printed, however, this is not a useful way of viewing the data as there is usually a large amount
+    def __check_block_lengths(self, offset, block_length, end_block_length):
+        """Check the last block stepped over by _walk_blocks() or _find_blocks()
 
         Parameters:
-            print_results (bool): Flag for whether to print the data read from the .UNSMRY file.
-            This can result in a large amount of information printed.
-            
-        Attributes:
-            seqhdr (list): The contents of the seqhdr sections from the .UNSMRY file
-                                ISNUM = an encoded integer corresponding to the time the file was created.
-            ministep (list): The contents of the ministep sections from the .UNSMRY file
-                                Ministep numbers (starting at zero and incremented by 1 at each subsequent step)
-            params (list): The contents of the params sections from the .UNSMRY file
-                                Vector parameter values at each ministep
-                                (corresponding to the vectors defined in the specification file)
-            dfparams (dataframe): A dataframe containing the summary data
-            
+            offset (int):           The position returned by _walk_blocks() or _find_blocks()
+            block_length (int):     The length at the start of the last block
+            end_block_length (int): The length at the end of the last block, or _TRUNCATED
+
         Raises:
-            Exception: if an unexpected section name encountered while reading .SMSPEC file
-        
-        """
-        with open(self.UNSMRYfile, "rb") as f:
-            self.seqhdr = list()
-            self.ministep = list()
-            self.params = list()
-            while True:
-                section_name, num_records, record_type = self.__read_block_header(f)
-                if print_results:
-                    print('Section: {}, expected records: {}:, record type: {}'.format(section_name,
-                                                                                       num_records,
-                                                                                       record_type))
-                if section_name == 'SEQHDR':
-                    self.seqhdr.append(self.__read_record(f, num_records, record_type, print_results))
-                elif section_name == 'MINISTEP':
-                    self.ministep.append(self.__read_record(f, num_records, record_type, print_results))
-                elif section_name == 'PARAMS':
-                    self.params.append(self.__read_record(f, num_records, record_type, print_results))
-                elif section_name == '':
-                    if print_results:
-                        print('End of file reached')
-                    break
-                else:
-                    raise Exception('Unexpected section name ({})'.format(section_name))
-        self.dfparams = pd.DataFrame(self.params)
+            Exception: If the file ends part way through the block
+            Exception: If the record of the block length at the start and end of a block do not match
+                            (only checked if verify_blocks is set)
 
-        # Summary file has been read in so set the on demand flag to False
-        self.__on_demand = False
-        return
+        """
+        if end_block_length == _TRUNCATED:
+            raise Exception('Unexpected end of file in the block at position {}.'.format(offset))
+        if block_length != end_block_length:
+            raise Exception('Start block length ({}) not equal to end block length ({}).'.format(block_length,
+                                                                                                 end_block_length))
 
-    def vector(self, keyword, identifier=''):
-        """Return a single vector from the summary data, either from data read in using __read_unsmry()
-            or else directly from .unsmry file
+    def __index_params(self, buf, sections=None):
+        """Find the position of each PARAMS section in the .UNSMRY file, so that a vector can be read
+            without stepping through the whole file
 
         Parameters:
-            keyword (string):    The vector to return
-            identifier (string): The identifier (well/group, etc) for the vector
-                                    will accept inter-region vectors e.g. RWFT '1 2'
-                                    will accept well connection quantities e.g. CWPR 'PRD_A 1'
+            buf (ndarray):     The contents of the .UNSMRY file
+            sections (tuple):  The result of __scan_unsmry() if the file has already been scanned (default=None)
 
-        Returns:
-            dataframe : Eclipse summary vector
+        Attributes:
+            __params_offsets (ndarray):   The position of the first block of each PARAMS section
+            __params_block_items (int):   The number of items in each full block of a PARAMS section
+            __params_stride (int):        The distance in bytes between consecutive PARAMS sections, or None if
+                                            the sections are not evenly spaced
+
+        Raises:
+            Exception: if an unexpected section name encountered while reading .UNSMRY file
+            Exception: If the record of the block length at the start and end of a block do not match
+            Exception: If the file ends part way through a section
 
         """
+        # Every section is stepped through by the compiled scan, so that the whole file is checked before
+        # any vector is read from it
+        kinds, _, offsets, _ = self.__scan_unsmry(buf) if sections is None else sections
+        params_offsets = offsets[kinds == 2]
+        block_items = self.nlist
+        if len(params_offsets) > 0:
+            block_items = _INT32.unpack_from(buf, params_offsets[0])[0] // 4
+        # Every ministep normally has the same layout, in which case the PARAMS sections are evenly spaced
+        strides = np.diff(params_offsets)
+        self.__params_stride = None
+        if len(params_offsets) == 1:
+            self.__params_stride = 0
+        elif len(params_offsets) > 1 and np.all(strides == strides[0]):
+            self.__params_stride = int(strides[0])
+        self.__params_offsets = np.array(params_offsets, dtype=np.int64)
+        self.__params_block_items = max(block_items, 1)
+        return
 
-        # Look up keyword and identifier depending on vector type
+    def __scan_unsmry(self, buf):
+        """Step through the sections of the .UNSMRY file using the compiled scan
 
-        # Special keywords that do not follow usual pattern of first letters
-        special_keywords = ['TIME', 'YEARS', 'DAY', 'MONTH', 'YEAR', 'ELAPSED', 'MAXDPR', 'MAXDSO', 'MAXDSG', 'MAXDSW',
-                            'NEWTON', 'NLINEARS', 'STEPTYPE',
-                            'TCPU', 'TCPUTS', 'TCPUDAY', 'TELAPTS', 'TELAPDAY', 'TIMESTEP']
-        sign_mult = 1
+        Parameters:
+            buf (ndarray): The contents of the .UNSMRY file
 
-        if keyword in special_keywords:
-            i = list(self.keywords_section).index((keyword))
+        Returns:
+            Tuple: (kinds, types, offsets, end_offsets)
+            kinds (ndarray):       0 for each SEQHDR, 1 for each MINISTEP and 2 for each PARAMS section
+            types (ndarray):       The position of the record type of each section in _RECORD_TYPES, or -1 if unknown
+            offsets (ndarray):     The position of the first block of each section
+            end_offsets (ndarray): The position in the file immediately after each section
 
-        elif keyword[0] == 'A':  # Aquifer
-            i = list(zip(self.keywords_section, self.nums_section)).index((keyword, identifier))
+        Raises:
+            Exception: if an unexpected section name encountered while reading .UNSMRY file
+            Exception: If the record of the block length at the start and end of a block do not match
+            Exception: If the file ends part way through a section
 
-        elif keyword[0] == 'B':  # Block data
-            # "Cell index, calculated from the natural position as (IZ-1)*NX*NY+(IY-1)*NX+IX"
-            #       - Eclipse File Formats Reference Manual
-            block_ix, block_iy, block_iz = tuple(identifier.split())
-            block_index = ((int(block_iz) - 1) * self.nx * self.ny) + ((int(block_iy) - 1) * self.nx) + int(block_ix)
-            i = list(zip(self.keywords_section, self.nums_section)).index((keyword, block_index))
+        """
+        kinds, types, offsets, end_offsets = _scan_sections(buf, _UNSMRY_SECTIONS, _RECORD_TYPE_NAMES,
+                                                            self.verify_blocks)
+        if len(kinds) > 0 and kinds[-1] < 0:
+            # Repeat the section that stopped the scan in python, to report the error
+            section_name, num_records, record_type, offset = self.__read_block_header(buf, int(offsets[-1]) - 24)
+            if kinds[-1] == -1:
+                raise Exception('Unexpected section name ({})'.format(section_name))
+            self.__skip_record(buf, offset, num_records, record_type)
+        return kinds, types, offsets, end_offsets
+
+    def __read_sections(self, buf, types, offsets, end_offsets):
+        """Read a set of small sections from the .UNSMRY file, such as all the MINISTEP sections, copying the data
+            of all the sections of each record type in a single call
 
-        elif keyword[0] == 'C':  # Completion or connection data
-            well_name, connection_number = tuple(identifier.split())
-            i = list(zip(self.keywords_section, self.wgnames_section, self.nums_section)).index(
-                (keyword, well_name, int(connection_number)))
+        Parameters:
+            buf (ndarray):         The contents of the .UNSMRY file
+            types (ndarray):       The position of the record type of each section in _RECORD_TYPES
+            offsets (ndarray):     The position of the first block of each section
+            end_offsets (ndarray): The position in the file immediately after each section
 
-        elif keyword[0] == 'E':  # Edge data produced by the FrontSim GEOFLOFS option or the ELAPSED keyword
-            i = list(self.keywords_section).index((keyword))
+        Returns:
+            list: The contents of each section, as returned by __read_record()
 
-        elif keyword[0] == 'F':  # Field data
-            i = list(self.keywords_section).index((keyword))
+        Raises:
+            Exception: If a section has an unrecognised record type
 
-        elif keyword[0] == 'G':  # Group data
-            i = list(zip(self.keywords_section, self.wgnames_section)).index((keyword, identifier))
+        """
+        results = [None] * len(types)
+        for type_index in np.unique(types).tolist():
+            selected = np.flatnonzero(types == type_index)
+            if type_index < 0:
+                _, _, record_type, _ = self.__read_block_header(buf, int(offsets[selected[0]]) - 24)
+                raise Exception('Unrecognised record type: {}.'.format(record_type))
+            record_type = _RECORD_TYPES[type_index]
+            dtype = np.dtype(_DTYPES[record_type])
+            data, lengths = _join_sections(buf, offsets[selected], end_offsets[selected])
+            values = self.__decode_record(data.view(dtype), record_type)
+            ends = np.cumsum(lengths // dtype.itemsize).tolist()
+            for i, start, end in zip(selected.tolist(), [0] + ends[:-1], ends):
+                results[i] = values[start:end]
+        return results
+
+    def __item_offsets(self, index):
+        """Calculate the position of one vector in every PARAMS section of the .UNSMRY file
 
-        elif keyword[0:2] == 'LB':  # Local grid block data
-            raise Exception(
-                'Keywords starting LB for Local grid block data not currently supported ({})'.format(keyword))
+        Parameters:
+            index (int): The index of the vector in the PARAMS sections
 
-        elif keyword[0:2] == 'LC':  # Local grid completion or connection data
-            raise Exception(
-                'Keywords starting LC for Local grid completion or connection data not currently supported ({})'.format(
-                    keyword))
+        Returns:
+            ndarray : The position of the vector at each ministep
 
-        elif keyword[0:2] == 'LW':  # Local grid well data
-            raise Exception(
-                'Keywords starting LW for Local grid well data not currently supported ({})'.format(keyword))
+        """
+        return self.__params_offsets + self.__item_position(index)
 
-        elif keyword[0] == 'N':  # Network node or network general data
-            i = list(zip(self.keywords_section, self.wgnames_section)).index((keyword, identifier))
+    def __item_position(self, index):
+        """Calculate the position of one or more vectors relative to the first block of a PARAMS section
 
-        elif keyword[0] == 'P':  # Network branch (or “pipe”) data
-            i = list(zip(self.keywords_section, self.wgnames_section)).index((keyword, identifier))
+        Parameters:
+            index (int or ndarray): The index of the vectors in the PARAMS sections
 
-        elif keyword[0] == 'R' and keyword[2] == 'F':  # Region to region flows
-            # "Combined region number calculated as IR1 + 32768*(IR2+10) where flow is from IR1 to IR2"
-            #       - Eclipse File Formats Reference Manual
-            region_num1, region_num2 = tuple(identifier.split())
-            combined_region_number_1 = int(region_num1) + (32768 * (int(region_num2) + 10))
-            combined_region_number_2 = int(region_num2) + (32768 * (int(region_num1) + 10))
-            try:
-                i = list(zip(self.keywords_section, self.nums_section)).index((keyword, combined_region_number_1))
-            except:
-                try:
-                    i = list(zip(self.keywords_section, self.nums_section)).index((keyword, combined_region_number_2))
-                    sign_mult = -1
-                except:
-                    raise Exception('No result found for identifier {}, '
-                                    '(NUMS {} or {})'.format(identifier,
-                                                                combined_region_number_1,
-                                                                combined_region_number_2))
+        Returns:
+            int or ndarray : The position of each vector relative to the start of the PARAMS section
 
-        elif keyword[0:2] == 'RC' and keyword[3] == 'M':  # Region with a component number
-            # "Combined region and component number calculated as IR + 32768*(IC+10)"
-            #       - Eclipse File Formats Reference Manual
-            region_num, comp_num = tuple(identifier.split())
-            combined_region_comp_number = int(region_num) + (32768 * (int(comp_num) + 10))
-            i = list(zip(self.keywords_section, self.nums_section)).index((keyword, combined_region_comp_number))
+        """
+        # PARAMS are split into blocks of equal length, each surrounded by the 4 byte block lengths
+        block_items = self.__params_block_items
+        return 4 + (index // block_items) * (block_items * 4 + 8) + (index % block_items) * 4
 
-        elif keyword[0] == 'R':  # Region data
-            # "Identifier: NUMS keyword. Optional WNAMES (or NAMES *) keyword
-            #   for simulators that support named regions."
-            #    - Eclipse File Formats Reference Manual
-            #      Possible this may need modification to be compatible with
-            #      WNAMES for Intersect if it supports named regions
-            i = list(zip(self.keywords_section, self.nums_section)).index((keyword, identifier))
+    def __read_params_item(self, buf, index):
+        """Read one vector from every PARAMS section of the mapped .UNSMRY file
 
-        elif keyword[0] == 'S':  # Well segment data
-            # "Well segment vectors require the well name and the segment number;
-            #   other vectors beginning with S require no additional data"
-            #       - Eclipse File Formats Reference Manual
-            #           Not sure what 'other vectors' this refers to - need to be careful about this
-            well_name, segment_number = tuple(identifier.split())
-            i = list(zip(self.keywords_section, self.wgnames_section, self.nums_section)).index(
-                (keyword, well_name, segment_number))
+        Parameters:
+            buf (ndarray): The contents of the .UNSMRY file
+            index (int):   The index of the vector in the PARAMS sections
 
-        elif keyword[0] == 'W':  # Well or completion data
-            i = list(zip(self.keywords_section, self.wgnames_section)).index((keyword, identifier))
+        Returns:
+            ndarray : The vector at each ministep, as a big-endian view of the file if the PARAMS sections are
+                        evenly spaced, otherwise as a copy
 
-        else:
-            raise Exception('Unexpected keyword first letter ({}) in keyword {}'.format(keyword[0], keyword))
+        """
+        item_offsets = self.__item_offsets(index)
+        self.__check_item_offsets(buf, item_offsets)
+        if self.__params_stride is not None and len(item_offsets) > 0:
+            # Evenly spaced sections, so the vector can be read as a strided view without copying
+            return np.ndarray(shape=len(item_offsets), dtype='>f4', buffer=buf, offset=item_offsets[0],
+                              strides=self.__params_stride)
+        return self.__gather_items(buf, item_offsets)
+
+    def __read_params_items(self, buf, indices):
+        """Read several vectors from every PARAMS section of the .UNSMRY file, once the sections have been found
+            by __index_params()
 
-        if not self.__on_demand:
-            # Return vector from whole summary file that has already been read
-            return self.dfparams[i] * sign_mult
-        else:
-            # seek through summary file to pull out individual vector
-            with open(self.UNSMRYfile, "rb") as f:
-                self.param = list()
-                while True:
-                    section_name, num_records, record_type = self.__read_block_header(f)
-
-                    if section_name == 'SEQHDR':
-                        self.__read_record_on_demand(f, 9999, num_records, record_type)
-                    elif section_name == 'MINISTEP':
-                        self.__read_record_on_demand(f, 9999, num_records, record_type)
-                    elif section_name == 'PARAMS':
-                        self.param.append(self.__read_record_on_demand(f, i, num_records, record_type))
-                    elif section_name == '':
-                        break
-                    else:
-                        raise Exception('Unexpected section name ({})'.format(section_name))
-            self.param = pd.DataFrame(self.param)
-            return self.param[0] * sign_mult
-        return
+        Parameters:
+            buf (ndarray):     The contents of the .UNSMRY file
+            indices (ndarray): The index of each vector in the PARAMS sections, in increasing order
 
-    # Set up functions to read the different types and return a list.
-    # Count is specified as a total number of bytes which should be divisible by the data length.
-    # If no count is specified, it defaults to the length of one data item.
+        Returns:
+            ndarray : The vectors in the byte order of the file, one row per vector and one column per ministep
 
-    def __read_strings(self, f, count=8):
-        """Read 8-character strings from the .SMSPEC or .UNSMRY file
+        """
+        num_ministeps = len(self.__params_offsets)
+        positions = self.__item_position(indices)
+        self.__check_item_offsets(buf, self.__params_offsets[-1:] + positions.max(initial=0))
+        if self.__params_stride is not None and num_ministeps > 0:
+            # Evenly spaced sections, so the file can be viewed as one row per ministep and the vectors
+            # picked out as columns of that view
+            rows = np.ndarray(shape=(num_ministeps, positions.max(initial=0) // 4 + 1), dtype='>f4', buffer=buf,
+                              offset=self.__params_offsets[0], strides=(self.__params_stride, 4))
+            return rows[:, positions // 4].T
+        # One gather for all vectors, ordered by ministep so that the file is read front to back
+        item_offsets = (self.__params_offsets[:, np.newaxis] + positions).ravel()
+        values = self.__gather_items(buf, item_offsets)
+        return values.reshape(num_ministeps, len(indices)).T
+
+    def __gather_items(self, buf, item_offsets):
+        """Copy one REAL from each of a set of positions in the .UNSMRY file. Uses the compiled parallel gather
+            if numba is installed, as the plain python loop would be far slower than numpy indexing.
+            Items must have been checked with __check_item_offsets(), as the compiled gather does not check its reads
 
         Parameters:
-            f (file):    The .SMSPEC or .UNSMRY file
-            count (int): The number of strings to be read
+            buf (ndarray):          The contents of the .UNSMRY file
+            item_offsets (ndarray): The position of each item in the file
 
         Returns:
-            list(string) : The strings read from the file
+            ndarray : The items in the byte order of the file
 
         """
-        strings = list()
-        length = 8
-        for i in range(0, count // length):
-            strings.append(f.read(length).decode(encoding='utf-8', errors='strict').strip())
-        return strings
+        if _NUMBA:
+            return _gather_items(buf, item_offsets, 4).view('>f4')
+        return buf[item_offsets[:, np.newaxis] + np.arange(4)].view('>f4').ravel()
 
-    def __read_strings_short(self, f, count=4):
-        """Read 4-character strings from the .SMSPEC or .UNSMRY file (mainly used for the data type descriptors)
+    def __check_item_offsets(self, buf, item_offsets):
+        """Check that items are inside the .UNSMRY file before they are read, so that a truncated file is
+            reported rather than failing part way through a read
 
         Parameters:
-            f (file):    The .SMSPEC or .UNSMRY file
-            count (int): The number of strings to be read
+            buf (ndarray):          The contents of the .UNSMRY file
+            item_offsets (ndarray): The position of each item to be read
 
-        Returns:
-            list(string) : The strings read from the file
+        Raises:
+            Exception: If an item lies beyond the end of the file
 
         """
-        strings = list()
-        length = 4
-        for i in range(0, count // length):
-            strings.append(f.read(length).decode(encoding='utf-8', errors='strict'))
-        return strings
+        if len(item_offsets) > 0 and item_offsets.max() + 4 > len(buf):
+            raise Exception('Item at position {} is beyond the end of the .UNSMRY file.'.format(item_offsets.max()))
 
-    def __read_integers(self, f, count=4):
-        """Read INTEs from the .SMSPEC or .UNSMRY file
+    def __read_unsmry(self, print_results=False):
+        """Read the whole .UNSMRY file which contains the vectors described in the .SMSPEC file.
+        Results can be printed, however, this is not a useful way of viewing the data as there is usually a large amount
 
         Parameters:
-            f (file):    The .SMSPEC or .UNSMRY file
-            count (int): The number of INTEs to be read
+            print_results (bool): Flag for whether to print the data read from the .UNSMRY file.
+            This can result in a large amount of information printed.
+            
+        Attributes:
+            seqhdr (list): The contents of the seqhdr sections from the .UNSMRY file
+                                ISNUM = an encoded integer corresponding to the time the file was created.
+            ministep (list): The contents of the ministep sections from the .UNSMRY file
+                                Ministep numbers (starting at zero and incremented by 1 at each subsequent step)
+            params (ndarray): The contents of the params sections from the .UNSMRY file
+                                Vector parameter values at each ministep
+                                (corresponding to the vectors defined in the specification file)
+                                This is a transposed view of __columns, one row per ministep
+            __columns (ndarray): The summary data stored one contiguous row per vector,
+                                so that each vector can be returned without gathering from every ministep
+            
+        Raises:
+            Exception: if an unexpected section name encountered while reading .SMSPEC file
+        
+        """
+        buf = self.__open(self.UNSMRYfile)
+        self.seqhdr = list()
+        self.ministep = list()
+        # A first pass over the section headers and block lengths only, which also finds the PARAMS sections.
+        kinds, types, offsets, end_offsets = self.__scan_unsmry(buf)
+        if print_results:
+            # The SEQHDR and MINISTEP sections are read one at a time, so that each can be printed
+            for kind, offset in zip(kinds.tolist(), offsets.tolist()):
+                section_name, num_records, record_type, offset = self.__read_block_header(buf, offset - 24)
+                print('Section: {}, expected records: {}:, record type: {}'.format(section_name,
+                                                                                   num_records,
+                                                                                   record_type))
+                if kind == 0:
+                    self.seqhdr.append(self.__read_record(buf, offset, num_records, record_type, print_results)[0])
+                elif kind == 1:
+                    self.ministep.append(self.__read_record(buf, offset, num_records, record_type, print_results)[0])
+            print('End of file reached')
+        else:
+            self.seqhdr = self.__read_sections(buf, types[kinds == 0], offsets[kinds == 0], end_offsets[kinds == 0])
+            self.ministep = self.__read_sections(buf, types[kinds == 1], offsets[kinds == 1], end_offsets[kinds == 1])
+
+        # All the PARAMS values are then copied into the columns in one step
+        self.__index_params(buf, (kinds, types, offsets, end_offsets))
+        self.__columns = np.ascontiguousarray(self.__read_params_items(buf, np.arange(self.nlist)), dtype=np.float32)
+        self.params = self.__columns.T
+        if print_results:
+            print(self.params)
+        self.__dfparams = None
+
+        # Summary file has been read in so set the on demand flag to False
+        self.__on_demand = False
+        return
+
+    def __cache_is_current(self):
+        """Check whether the cache files exist and were written after the summary files were last changed
 
         Returns:
-            list(integer) : The INTEs read from the file
+            bool: True if the cache can be used in place of the summary files
 
         """
-        integers = list()
-        length = 4
-        for i in range(0, count // length):
-            integers.append(int.from_bytes(f.read(length), byteorder='big'))
-        return integers
+        if not all(os.path.isfile(filename) for filename in self.__cache_files):
+            return False
+        cache_time = min(os.path.getmtime(filename) for filename in self.__cache_files)
+        return cache_time >= max(os.path.getmtime(self.SMSPECfile), os.path.getmtime(self.UNSMRYfile))
+
+    def __save_cache(self):
+        """Write the summary data to a numpy file, and the .SMSPEC sections, seqhdr and ministep to a numpy
+            archive. Only arrays are stored, so that loading the cache never runs code from the files.
+            CHAR sections are stored as arrays of strings and returned to lists when loaded.
+            Each file is written under a temporary name and then renamed, so that an interrupted write never
+            leaves a partial cache file, and a cache which cannot be written is skipped.
+        """
+        # Read any skipped sections so that the cache holds all of them
+        for section_name in list(self.__skipped_sections):
+            getattr(self, section_name.lower() + '_section')
+        arrays = {name: value if isinstance(value, np.ndarray) else np.array(value, dtype=str)
+                  for name, value in vars(self).items() if name.endswith('_section')}
+        # Each list of SEQHDR or MINISTEP sections is stored joined, with the number of items in each section
+        for name in ('seqhdr', 'ministep'):
+            sections = getattr(self, name)
+            arrays[name] = np.concatenate(sections) if len(sections) > 0 else np.empty(0, dtype=np.int32)
+            arrays[name + '_lengths'] = np.array([len(section) for section in sections], dtype=np.int64)
+        params_file, smspec_file = self.__cache_files
+        temporary_files = [params_file + '.tmp', smspec_file + '.tmp']
+        try:
+            # Written through file objects, as np.save and np.savez would add their own extension to the name
+            with open(temporary_files[0], 'wb') as f:
+                np.save(f, self.__columns)
+            with open(temporary_files[1], 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(temporary_files[1], smspec_file)
+            os.replace(temporary_files[0], params_file)
+        except OSError:
+            for filename in temporary_files:
+                if os.path.isfile(filename):
+                    os.remove(filename)
+
+    def __load_cache(self):
+        """Load the summary data and .SMSPEC sections written by __save_cache() in place of reading the summary files
+
+        Returns:
+            bool: True if the cache was loaded, False if it could not be read, in which case nothing is set and
+                    the summary files are read instead
 
-    def __read_doubles(self, f, count=8):
-        """Read DOUBs from the .SMSPEC or .UNSMRY file
+        Attributes:
+            The .SMSPEC sections, seqhdr, ministep and params as set by __read_smspec() and __read_unsmry()
 
-        Parameters:
-            f (file):    The .SMSPEC or .UNSMRY file
-            count (int): The number of DOUBs to be read
+        """
+        params_file, smspec_file = self.__cache_files
+        results = dict()
+        try:
+            with np.load(smspec_file, allow_pickle=False) as cache:
+                for name in cache.files:
+                    if name.endswith('_section'):
+                        value = cache[name]
+                        # CHAR sections are the only arrays of strings, and are returned as lists as when read
+                        results[name] = value.tolist() if value.dtype.kind == 'U' else value
+                for name in ('seqhdr', 'ministep'):
+                    values = cache[name]
+                    ends = np.cumsum(cache[name + '_lengths']).tolist()
+                    results[name] = [values[start:end] for start, end in zip([0] + ends[:-1], ends)]
+            columns = np.load(params_file, allow_pickle=False)
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            return False
+        for name, value in results.items():
+            setattr(self, name, value)
+        self.__columns = columns
+        self.params = self.__columns.T
+        self.__on_demand = False
+        return True
+
+    @property
+    def dfparams(self):
+        """A dataframe containing the summary data, one column per vector.
+        Built from the stored columns on first use, reading the whole summary file if required.
 
         Returns:
-            list(float) : The DOUBs read from the file
+            dataframe : Eclipse summary data
 
         """
-        doubles = list()
-        length = 8
-        for i in range(0, count // length):
-            doubles.append(struct.unpack('<d', f.read(length)))
-        return doubles
+        if self.__columns is None:
+            self.__read_unsmry()
+        if self.__dfparams is None:
+            self.__dfparams = pd.DataFrame(self.__columns.T, copy=False)
+        return self.__dfparams
 
-    def __read_reals(self, f, count=4):
-        """Read REALs from the .SMSPEC or .UNSMRY file
+    def vector(self, keyword, identifier='', dtype=np.float32):
+        """Return a single vector from the summary data, either from data read in using __read_unsmry()
+            or else directly from .unsmry file
 
         Parameters:
-            f (file):    The .SMSPEC or .UNSMRY file
-            count (int): The number of REALs to be read
+            keyword (string):    The vector to return
+            identifier (string): The identifier (well/group, etc) for the vector
+                                    will accept inter-region vectors e.g. RWFT '1 2'
+                                    will accept well connection quantities e.g. CWPR 'PRD_A 1'
+            dtype (dtype):       The data type of the returned vector (default=float32, the precision stored in the
+                                    .UNSMRY file), e.g. float64 to upcast the values
 
         Returns:
-            list(float) : The REALs read from the file
+            series : Eclipse summary vector, named 'keyword:identifier'
+
+        Raises:
+            ValueError: if the vector is not in the summary data
 
         """
-        reals = list()
-        length = 4
-        for i in range(0, count // length):
-            reals.append(struct.unpack('>f', f.read(length))[0])
-        return reals
+        i, sign_mult = self.__catalog.find(keyword, identifier)
+        name = '{}:{}'.format(keyword, identifier)
+        if not self.__on_demand:
+            # Return vector from whole summary file that has already been read, copied straight from its
+            # stored column so that dfparams does not need to be built
+            values = self.__columns[i].astype(dtype)
+        else:
+            # read the vector directly from each PARAMS section of the summary file
+            buf = self.__map_unsmry()
+            values = self.__read_params_item(buf, i).astype(dtype)
+        if sign_mult != 1:
+            values *= sign_mult
+        return pd.Series(values, name=name, copy=False)
 
-    def __read_logis(self, f, count=4):
-        """Read LOGIs from the .SMSPEC or .UNSMRY file
+    def vectors(self, pairs, dtype=np.float32):
+        """Return several vectors from the summary data, reading the .unsmry file once for all of them
 
         Parameters:
-            f (file):    The .SMSPEC or .UNSMRY file
-            count (int): The number of LOGIs to be read
+            pairs (list):  (keyword, identifier) tuples for the vectors to return, as accepted by vector()
+            dtype (dtype): The data type of the returned vectors (default=float32)
 
         Returns:
-            list(integer) : The LOGIs read from the file
+            dataframe : Eclipse summary vectors, one column per pair named 'keyword:identifier'
 
         """
-        logis = list()
-        length = 4
-        for i in range(0, count // length):
-            logis.append((int.from_bytes(f.read(length), byteorder='big')) > 0)
-        return logis
+        positions = [self.__catalog.find(keyword, identifier) for keyword, identifier in pairs]
+        indices = np.array([i for i, _ in positions], dtype=np.int64)
+        sign_mults = np.array([sign_mult for _, sign_mult in positions], dtype=dtype)
+        names = ['{}:{}'.format(keyword, identifier) for keyword, identifier in pairs]
+        # Each vector is read once, in the order it is stored, however many times and in whatever order it is requested
+        unique_indices, inverse = np.unique(indices, return_inverse=True)
+        if not self.__on_demand:
+            values = self.__columns[unique_indices]
+        else:
+            values = self.__read_params_items(self.__map_unsmry(), unique_indices)
+        values = values.astype(dtype)[inverse] * sign_mults[:, np.newaxis]
+        return pd.DataFrame(values.T, columns=names, copy=False)
 
 
 if __name__ == '__main__':